@@ -0,0 +1,164 @@
+import os
+
+from numba import jit, prange
+
+# detect whether to use parallel or not
+numba_threads = int(os.getenv("NUMBA_NUM_THREADS", "1"))
+parallel = True if numba_threads != 1 else False
+
+# Note that all kernels work on a three-dimensional view of the input and
+# output arrays of size (n0, n, n1), where n is the number of samples along
+# the axis of the derivative and n0 and n1 are the products of the dimensions
+# before and after such axis. This view can be obtained from any C-contiguous
+# array without copying. The output array ``y`` is fully overwritten, so it
+# does not need to be initialized before calling the kernels. When n < 3, no
+# sample of the stencils can be computed and ``y`` is filled with zeros.
+
+
+@jit(nopython=True, fastmath=True, nogil=True, parallel=parallel)
+def _matvec_forward_numba(x, y, inv_dx2, edge):
+    """numba implementation of forward mode with forward stencil.
+    See official documentation for description of variables
+    """
+    n0, n, n1 = x.shape
+    if n < 3:
+        y[:] = 0
+        return y
+    for i0 in prange(n0):
+        for i in range(n - 2):
+            for i1 in range(n1):
+                y[i0, i, i1] = (
+                    x[i0, i + 2, i1] - 2 * x[i0, i + 1, i1] + x[i0, i, i1]
+                ) * inv_dx2
+        for i1 in range(n1):
+            y[i0, n - 2, i1] = 0
+            y[i0, n - 1, i1] = 0
+    return y
+
+
+@jit(nopython=True, fastmath=True, nogil=True, parallel=parallel)
+def _rmatvec_forward_numba(x, y, inv_dx2, edge):
+    """numba implementation of adjoint mode with forward stencil.
+    See official documentation for description of variables
+    """
+    n0, n, n1 = x.shape
+    if n < 3:
+        y[:] = 0
+        return y
+    for i0 in prange(n0):
+        for i in range(2, n):
+            for i1 in range(n1):
+                y[i0, i, i1] = (
+                    x[i0, i - 2, i1] - 2 * x[i0, i - 1, i1] + x[i0, i, i1]
+                ) * inv_dx2
+        for i1 in range(n1):
+            y[i0, 0, i1] = x[i0, 0, i1] * inv_dx2
+            y[i0, 1, i1] = (x[i0, 1, i1] - 2 * x[i0, 0, i1]) * inv_dx2
+            y[i0, n - 1, i1] = x[i0, n - 3, i1] * inv_dx2
+            y[i0, n - 2, i1] -= x[i0, n - 2, i1] * inv_dx2
+    return y
+
+
+@jit(nopython=True, fastmath=True, nogil=True, parallel=parallel)
+def _matvec_centered_numba(x, y, inv_dx2, edge):
+    """numba implementation of forward mode with centered stencil.
+    See official documentation for description of variables
+    """
+    n0, n, n1 = x.shape
+    if n < 3:
+        y[:] = 0
+        return y
+    for i0 in prange(n0):
+        for i in range(1, n - 1):
+            for i1 in range(n1):
+                y[i0, i, i1] = (
+                    x[i0, i + 1, i1] - 2 * x[i0, i, i1] + x[i0, i - 1, i1]
+                ) * inv_dx2
+        for i1 in range(n1):
+            if edge:
+                y[i0, 0, i1] = (
+                    x[i0, 0, i1] - 2 * x[i0, 1, i1] + x[i0, 2, i1]
+                ) * inv_dx2
+                y[i0, n - 1, i1] = (
+                    x[i0, n - 3, i1] - 2 * x[i0, n - 2, i1] + x[i0, n - 1, i1]
+                ) * inv_dx2
+            else:
+                y[i0, 0, i1] = 0
+                y[i0, n - 1, i1] = 0
+    return y
+
+
+@jit(nopython=True, fastmath=True, nogil=True, parallel=parallel)
+def _rmatvec_centered_numba(x, y, inv_dx2, edge):
+    """numba implementation of adjoint mode with centered stencil.
+    See official documentation for description of variables
+    """
+    n0, n, n1 = x.shape
+    if n < 3:
+        y[:] = 0
+        return y
+    for i0 in prange(n0):
+        for i in range(1, n - 1):
+            for i1 in range(n1):
+                y[i0, i, i1] = (
+                    x[i0, i + 1, i1] - 2 * x[i0, i, i1] + x[i0, i - 1, i1]
+                ) * inv_dx2
+        for i1 in range(n1):
+            # remove contributions of first and last samples of x
+            # as they are not used in the forward
+            y[i0, 0, i1] = x[i0, 1, i1] * inv_dx2
+            y[i0, n - 1, i1] = x[i0, n - 2, i1] * inv_dx2
+            y[i0, 1, i1] -= x[i0, 0, i1] * inv_dx2
+            y[i0, n - 2, i1] -= x[i0, n - 1, i1] * inv_dx2
+            if edge:
+                y[i0, 0, i1] += x[i0, 0, i1] * inv_dx2
+                y[i0, 1, i1] -= 2 * x[i0, 0, i1] * inv_dx2
+                y[i0, 2, i1] += x[i0, 0, i1] * inv_dx2
+                y[i0, n - 3, i1] += x[i0, n - 1, i1] * inv_dx2
+                y[i0, n - 2, i1] -= 2 * x[i0, n - 1, i1] * inv_dx2
+                y[i0, n - 1, i1] += x[i0, n - 1, i1] * inv_dx2
+    return y
+
+
+@jit(nopython=True, fastmath=True, nogil=True, parallel=parallel)
+def _matvec_backward_numba(x, y, inv_dx2, edge):
+    """numba implementation of forward mode with backward stencil.
+    See official documentation for description of variables
+    """
+    n0, n, n1 = x.shape
+    if n < 3:
+        y[:] = 0
+        return y
+    for i0 in prange(n0):
+        for i in range(2, n):
+            for i1 in range(n1):
+                y[i0, i, i1] = (
+                    x[i0, i, i1] - 2 * x[i0, i - 1, i1] + x[i0, i - 2, i1]
+                ) * inv_dx2
+        for i1 in range(n1):
+            y[i0, 0, i1] = 0
+            y[i0, 1, i1] = 0
+    return y
+
+
+@jit(nopython=True, fastmath=True, nogil=True, parallel=parallel)
+def _rmatvec_backward_numba(x, y, inv_dx2, edge):
+    """numba implementation of adjoint mode with backward stencil.
+    See official documentation for description of variables
+    """
+    n0, n, n1 = x.shape
+    if n < 3:
+        y[:] = 0
+        return y
+    for i0 in prange(n0):
+        for i in range(n - 2):
+            for i1 in range(n1):
+                y[i0, i, i1] = (
+                    x[i0, i, i1] - 2 * x[i0, i + 1, i1] + x[i0, i + 2, i1]
+                ) * inv_dx2
+        for i1 in range(n1):
+            y[i0, n - 1, i1] = x[i0, n - 1, i1] * inv_dx2
+            y[i0, n - 2, i1] = (x[i0, n - 2, i1] - 2 * x[i0, n - 1, i1]) * inv_dx2
+            y[i0, 0, i1] = x[i0, 2, i1] * inv_dx2
+            y[i0, 1, i1] -= x[i0, 1, i1] * inv_dx2
+    return y
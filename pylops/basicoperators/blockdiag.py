@@ -1,6 +1,8 @@
 __all__ = ["BlockDiag"]
 
+import concurrent.futures as mt
 import multiprocessing as mp
+from itertools import accumulate
 
 import numpy as np
 import scipy as sp
@@ -17,7 +19,7 @@ else:
         LinearOperator as spLinearOperator,
     )
 
-from typing import Optional, Sequence
+from typing import Any, Dict, Optional, Sequence, Union
 
 from pylops import LinearOperator
 from pylops.basicoperators import MatrixMult
@@ -30,6 +32,39 @@ def _matvec_rmatvec_map(op, x: NDArray) -> NDArray:
     return op(x).squeeze()
 
 
+# operators and shared input/output buffers of a multiprocessing worker
+_shared: Dict[str, Any] = {}
+
+
+def _init_shared(ops: Sequence[LinearOperator], xraw, yraw, dtype: DTypeLike) -> None:
+    """initializer of multiprocessing workers: operators are pickled (or
+    inherited when forking) only once here and the input and output
+    buffers are shared with the main process"""
+    _shared["ops"] = ops
+    _shared["x"] = np.frombuffer(xraw, dtype=dtype)
+    _shared["y"] = np.frombuffer(yraw, dtype=dtype)
+
+
+def _matvec_rmatvec_shared(
+    iop: int, adj: bool, xstart: int, xend: int, ystart: int, yend: int
+) -> None:
+    """matvec/rmatvec for multiprocessing with shared buffers"""
+    op = _shared["ops"][iop]
+    op = op._rmatvec if adj else op._matvec
+    _shared["y"][ystart:yend] = op(_shared["x"][xstart:xend]).squeeze()
+
+
+def _matvec_rmatvec_map_inplace(op, x: NDArray, y: NDArray) -> None:
+    """matvec/rmatvec for multithreading (writes directly into y)"""
+    y[:] = op(x).squeeze()
+
+
+# maximum number of elements of each matrix for the operators to be stacked
+# into a single batched matrix multiplication (large blocks gain nothing from
+# batching, whilst the stack doubles the memory footprint of the operator)
+_STACKED_MAXSIZE = 4096
+
+
 class BlockDiag(LinearOperator):
     r"""Block-diagonal operator.
 
@@ -42,8 +77,28 @@ class BlockDiag(LinearOperator):
         :obj:`numpy.ndarray` or :obj:`scipy.sparse` matrices can be passed
         in place of one or more operators.
     nproc : :obj:`int`, optional
-        Number of processes used to evaluate the N operators in parallel using
-        ``multiprocessing``. If ``nproc=1``, work in serial mode.
+        Number of processes (or threads) used to evaluate the N operators in
+        parallel using ``multiprocessing`` (or ``concurrent.futures``). If
+        ``nproc=1``, work in serial mode.
+    multiproc : :obj:`bool`, optional
+        .. versionadded:: 2.3.0
+
+        Use multiprocessing (``True``) or multithreading (``False``) when
+        ``nproc>1``. Multithreading avoids pickling the operators and the
+        input/output vectors at every call, and is therefore preferable
+        when the N operators release the GIL (e.g., most operators relying
+        on NumPy/SciPy routines).
+
+        .. note:: When using multiprocessing, the operators are sent to the
+          worker processes only once, when the pool is created, and input
+          and output vectors are exchanged via shared memory. As such,
+          operators should not be modified after the creation of
+          ``BlockDiag``. Moreover, the operators are copied into each worker
+          (inherited when processes are forked, pickled otherwise, e.g. with
+          the ``spawn`` start method used by default on Windows and macOS).
+          Finally, since the shared buffers belong to the operator, this path
+          is not re-entrant: the same ``BlockDiag`` must not be applied by
+          concurrent calls (e.g., from multiple threads).
     forceflat : :obj:`bool`, optional
         .. versionadded:: 2.2.0
 
@@ -61,6 +116,17 @@ class BlockDiag(LinearOperator):
 
     Notes
     -----
+    When all operators are :class:`pylops.MatrixMult` operators of the same
+    (small) shape and ``nproc=1``, their matrices are stacked at construction
+    and the block-diagonal operator is applied as a single batched matrix
+    multiplication. The stacked matrices are a copy of those of the operators:
+    as such, subsequent changes to ``op.A`` are not reflected in ``BlockDiag``.
+
+    Note also that the operators are applied through their private
+    ``_matvec``/``_rmatvec`` methods (bypassing the input checks of the public
+    ones): as such, their ``matvec_count`` and ``rmatvec_count`` are not
+    updated when ``BlockDiag`` is applied.
+
     A block-diagonal operator composed of N linear operators is created such
     as its application in forward mode leads to
 
@@ -108,25 +174,55 @@ class BlockDiag(LinearOperator):
 
     """
 
+    _supports_out = True
+
     def __init__(
         self,
         ops: Sequence[LinearOperator],
         nproc: int = 1,
         forceflat: bool = None,
         dtype: Optional[DTypeLike] = None,
+        multiproc: bool = True,
     ) -> None:
-        self.ops = ops
-        mops = np.zeros(len(ops), dtype=int)
-        nops = np.zeros(len(ops), dtype=int)
-        for iop, oper in enumerate(ops):
+        # wrap non-LinearOperators into MatrixMult and gather the shapes of
+        # the operators and their (cached) matvec/rmatvec in a single pass
+        # (shapes are fixed, so input checks of the public methods can be
+        # bypassed; note that counters of the operators are not updated)
+        self.ops = []
+        self._ops_mv, self._ops_rmv = [], []
+        nops, mops = [], []
+        for oper in ops:
             if not isinstance(oper, (LinearOperator, spLinearOperator)):
-                self.ops[iop] = MatrixMult(oper, dtype=oper.dtype)
-            nops[iop] = self.ops[iop].shape[0]
-            mops[iop] = self.ops[iop].shape[1]
-        self.nops = int(nops.sum())
-        self.mops = int(mops.sum())
-        self.nnops = np.insert(np.cumsum(nops), 0, 0)
-        self.mmops = np.insert(np.cumsum(mops), 0, 0)
+                oper = MatrixMult(oper, dtype=oper.dtype)
+            self.ops.append(oper)
+            self._ops_mv.append(oper._matvec)
+            self._ops_rmv.append(oper._rmatvec)
+            nops.append(oper.shape[0])
+            mops.append(oper.shape[1])
+        self.nnops = np.fromiter(
+            accumulate(nops, initial=0), dtype=np.intp, count=len(ops) + 1
+        )
+        self.mmops = np.fromiter(
+            accumulate(mops, initial=0), dtype=np.intp, count=len(ops) + 1
+        )
+        self.nops = int(self.nnops[-1])
+        self.mops = int(self.mmops[-1])
+        # stack the matrices of the operators when they are all small dense
+        # MatrixMult of same shape (block-diagonal action becomes a
+        # single batched matrix multiplication)
+        self._stacked, self._stacked_H = None, None
+        if all(
+            isinstance(oper, MatrixMult)
+            and not oper.reshape
+            and isinstance(oper.A, get_array_module(oper.A).ndarray)
+            and oper.A.size <= _STACKED_MAXSIZE
+            and oper.A.shape == self.ops[0].A.shape
+            for oper in self.ops
+        ):
+            ncp = get_array_module(self.ops[0].A)
+            # (N, n, m) stack of C-contiguous matrices (its conjugate
+            # transpose is created at the first call of rmatvec)
+            self._stacked = ncp.stack([oper.A for oper in self.ops])
         # define dims (check if all operators have the same,
         # otherwise make same as self.mops and forceflat=True)
         dims = [op.dims for op in self.ops]
@@ -143,12 +239,6 @@ class BlockDiag(LinearOperator):
         else:
             dimsd = (self.nops,)
             forceflat = True
-        # create pool for multiprocessing
-        self._nproc = nproc
-        self.pool: Optional[mp.pool.Pool] = None
-        if self.nproc > 1:
-            self.pool = mp.Pool(processes=nproc)
-
         dtype = _get_dtype(ops) if dtype is None else np.dtype(dtype)
         clinear = all([getattr(oper, "clinear", True) for oper in self.ops])
         super().__init__(
@@ -159,6 +249,13 @@ class BlockDiag(LinearOperator):
             forceflat=forceflat,
         )
 
+        # create pool for multiprocessing/multithreading
+        self._nproc = nproc
+        self.multiproc = multiproc
+        self.pool: Optional[Union[mp.pool.Pool, mt.ThreadPoolExecutor]] = None
+        if self.nproc > 1:
+            self.pool = self._create_pool(nproc)
+
     @property
     def nproc(self) -> int:
         return self._nproc
@@ -166,32 +263,75 @@ class BlockDiag(LinearOperator):
     @nproc.setter
     def nproc(self, nprocnew: int) -> None:
         if self._nproc > 1 and self.pool is not None:
-            self.pool.close()
+            if self.multiproc:
+                self.pool.close()
+            else:
+                self.pool.shutdown()
         if nprocnew > 1:
-            self.pool = mp.Pool(processes=nprocnew)
+            self.pool = self._create_pool(nprocnew)
         self._nproc = nprocnew
 
-    def _matvec_serial(self, x: NDArray) -> NDArray:
+    def _create_pool(self, nproc: int):
+        if not self.multiproc:
+            return mt.ThreadPoolExecutor(max_workers=nproc)
+        # allocate input and output buffers shared with the worker processes
+        # (large enough to be used for both matvec and rmatvec)
+        if not hasattr(self, "_xraw"):
+            nbytes = max(self.nops, self.mops) * self.dtype.itemsize
+            self._xraw = mp.RawArray("b", nbytes)
+            self._yraw = mp.RawArray("b", nbytes)
+            self._xshared = np.frombuffer(self._xraw, dtype=self.dtype)
+            self._yshared = np.frombuffer(self._yraw, dtype=self.dtype)
+        return mp.Pool(
+            processes=nproc,
+            initializer=_init_shared,
+            initargs=(self.ops, self._xraw, self._yraw, self.dtype),
+        )
+
+    def _matvec_serial(self, x: NDArray, out: Optional[NDArray] = None) -> NDArray:
         ncp = get_array_module(x)
-        y = ncp.zeros(self.nops, dtype=self.dtype)
-        for iop, oper in enumerate(self.ops):
-            y[self.nnops[iop] : self.nnops[iop + 1]] = oper.matvec(
-                x[self.mmops[iop] : self.mmops[iop + 1]]
-            ).squeeze()
+        y = ncp.empty(self.nops, dtype=self.dtype) if out is None else out
+        nnops, mmops = self.nnops, self.mmops
+        for iop, matvec in enumerate(self._ops_mv):
+            y[nnops[iop] : nnops[iop + 1]] = matvec(
+                x[mmops[iop] : mmops[iop + 1]]
+            ).ravel()
         return y
 
-    def _rmatvec_serial(self, x: NDArray) -> NDArray:
+    def _rmatvec_serial(self, x: NDArray, out: Optional[NDArray] = None) -> NDArray:
         ncp = get_array_module(x)
-        y = ncp.zeros(self.mops, dtype=self.dtype)
-        for iop, oper in enumerate(self.ops):
-            y[self.mmops[iop] : self.mmops[iop + 1]] = oper.rmatvec(
-                x[self.nnops[iop] : self.nnops[iop + 1]]
-            ).squeeze()
+        y = ncp.empty(self.mops, dtype=self.dtype) if out is None else out
+        nnops, mmops = self.nnops, self.mmops
+        for iop, rmatvec in enumerate(self._ops_rmv):
+            y[mmops[iop] : mmops[iop + 1]] = rmatvec(
+                x[nnops[iop] : nnops[iop + 1]]
+            ).ravel()
         return y
 
-    def _matvec_multiproc(self, x: NDArray) -> NDArray:
+    def _matvec_multiproc(self, x: NDArray, out: Optional[NDArray] = None) -> NDArray:
         if self.pool is None:
             raise ValueError
+        if np.can_cast(x.dtype, self.dtype, casting="safe"):
+            self._xshared[: self.mops] = x.ravel()
+            self.pool.starmap(
+                _matvec_rmatvec_shared,
+                [
+                    (
+                        iop,
+                        False,
+                        self.mmops[iop],
+                        self.mmops[iop + 1],
+                        self.nnops[iop],
+                        self.nnops[iop + 1],
+                    )
+                    for iop in range(len(self.ops))
+                ],
+            )
+            if out is None:
+                return self._yshared[: self.nops].copy()
+            out[:] = self._yshared[: self.nops]
+            return out
+        # input cannot be safely cast into the shared buffer, send slices to workers
         ys = self.pool.starmap(
             _matvec_rmatvec_map,
             [
@@ -199,12 +339,35 @@ class BlockDiag(LinearOperator):
                 for iop, oper in enumerate(self.ops)
             ],
         )
-        y = np.hstack(ys)
+        y = np.empty(self.nops, dtype=self.dtype) if out is None else out
+        for iop in range(len(self.ops)):
+            y[self.nnops[iop] : self.nnops[iop + 1]] = ys[iop]
         return y
 
-    def _rmatvec_multiproc(self, x: NDArray) -> NDArray:
+    def _rmatvec_multiproc(self, x: NDArray, out: Optional[NDArray] = None) -> NDArray:
         if self.pool is None:
             raise ValueError
+        if np.can_cast(x.dtype, self.dtype, casting="safe"):
+            self._xshared[: self.nops] = x.ravel()
+            self.pool.starmap(
+                _matvec_rmatvec_shared,
+                [
+                    (
+                        iop,
+                        True,
+                        self.nnops[iop],
+                        self.nnops[iop + 1],
+                        self.mmops[iop],
+                        self.mmops[iop + 1],
+                    )
+                    for iop in range(len(self.ops))
+                ],
+            )
+            if out is None:
+                return self._yshared[: self.mops].copy()
+            out[:] = self._yshared[: self.mops]
+            return out
+        # input cannot be safely cast into the shared buffer, send slices to workers
         ys = self.pool.starmap(
             _matvec_rmatvec_map,
             [
@@ -212,19 +375,107 @@ class BlockDiag(LinearOperator):
                 for iop, oper in enumerate(self.ops)
             ],
         )
-        y = np.hstack(ys)
+        y = np.empty(self.mops, dtype=self.dtype) if out is None else out
+        for iop in range(len(self.ops)):
+            y[self.mmops[iop] : self.mmops[iop + 1]] = ys[iop]
         return y
 
-    def _matvec(self, x: NDArray) -> NDArray:
-        if self.nproc == 1:
-            y = self._matvec_serial(x)
+    def _matvec_multithread(self, x: NDArray, out: Optional[NDArray] = None) -> NDArray:
+        if self.pool is None:
+            raise ValueError
+        ncp = get_array_module(x)
+        y = ncp.empty(self.nops, dtype=self.dtype) if out is None else out
+        futures = [
+            self.pool.submit(
+                _matvec_rmatvec_map_inplace,
+                oper._matvec,
+                x[self.mmops[iop] : self.mmops[iop + 1]],
+                y[self.nnops[iop] : self.nnops[iop + 1]],
+            )
+            for iop, oper in enumerate(self.ops)
+        ]
+        # wait for all operators to complete (and re-raise exceptions, if any)
+        for future in futures:
+            future.result()
+        return y
+
+    def _rmatvec_multithread(
+        self, x: NDArray, out: Optional[NDArray] = None
+    ) -> NDArray:
+        if self.pool is None:
+            raise ValueError
+        ncp = get_array_module(x)
+        y = ncp.empty(self.mops, dtype=self.dtype) if out is None else out
+        futures = [
+            self.pool.submit(
+                _matvec_rmatvec_map_inplace,
+                oper._rmatvec,
+                x[self.nnops[iop] : self.nnops[iop + 1]],
+                y[self.mmops[iop] : self.mmops[iop + 1]],
+            )
+            for iop, oper in enumerate(self.ops)
+        ]
+        # wait for all operators to complete (and re-raise exceptions, if any)
+        for future in futures:
+            future.result()
+        return y
+
+    def _matvec_stacked(self, x: NDArray, out: Optional[NDArray] = None) -> NDArray:
+        ncp = get_array_module(x)
+        nop, nrow, ncol = self._stacked.shape
+        return self._matmul_stacked(
+            ncp, self._stacked, x.reshape(nop, ncol, 1), nrow, out
+        )
+
+    def _rmatvec_stacked(self, x: NDArray, out: Optional[NDArray] = None) -> NDArray:
+        ncp = get_array_module(x)
+        nop, nrow, ncol = self._stacked.shape
+        if self._stacked_H is None:
+            # conjugate transpose stored as a contiguous (N, m, n) stack such
+            # that also the adjoint is computed with contiguous inner matrices
+            self._stacked_H = ncp.ascontiguousarray(
+                self._stacked.conj().transpose(0, 2, 1)
+            )
+        return self._matmul_stacked(
+            ncp,
+            self._stacked_H,
+            x.reshape(nop, nrow, 1),
+            ncol,
+            out,
+        )
+
+    def _matmul_stacked(
+        self, ncp, stacked: NDArray, x: NDArray, n: int, out: Optional[NDArray]
+    ) -> NDArray:
+        # batched matrix multiplication, written directly into out when
+        # provided and with the same dtype of the result
+        if out is not None and out.dtype == ncp.result_type(stacked, x):
+            ncp.matmul(stacked, x, out=out.reshape(len(self.ops), n, 1))
+            return out
+        y = ncp.matmul(stacked, x).astype(self.dtype, copy=False).ravel()
+        if out is None:
+            return y
+        out[:] = y
+        return out
+
+    def _matvec(self, x: NDArray, out: Optional[NDArray] = None) -> NDArray:
+        if self.nproc == 1 and self._stacked is not None:
+            y = self._matvec_stacked(x, out=out)
+        elif self.nproc == 1:
+            y = self._matvec_serial(x, out=out)
+        elif self.multiproc:
+            y = self._matvec_multiproc(x, out=out)
         else:
-            y = self._matvec_multiproc(x)
+            y = self._matvec_multithread(x, out=out)
         return y
 
-    def _rmatvec(self, x: NDArray) -> NDArray:
-        if self.nproc == 1:
-            y = self._rmatvec_serial(x)
+    def _rmatvec(self, x: NDArray, out: Optional[NDArray] = None) -> NDArray:
+        if self.nproc == 1 and self._stacked is not None:
+            y = self._rmatvec_stacked(x, out=out)
+        elif self.nproc == 1:
+            y = self._rmatvec_serial(x, out=out)
+        elif self.multiproc:
+            y = self._rmatvec_multiproc(x, out=out)
         else:
-            y = self._rmatvec_multiproc(x)
+            y = self._rmatvec_multithread(x, out=out)
         return y
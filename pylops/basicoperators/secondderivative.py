@@ -1,16 +1,39 @@
 __all__ = ["SecondDerivative"]
 
-from typing import Callable, Union
+import logging
+from typing import Callable, Optional, Union
 
 import numpy as np
 from numpy.core.multiarray import normalize_axis_index
 
 from pylops import LinearOperator
+from pylops.utils import deps
 from pylops.utils._internal import _value_or_sized_to_tuple
 from pylops.utils.backend import get_array_module
-from pylops.utils.decorators import reshaped
 from pylops.utils.typing import DTypeLike, InputDimsLike, NDArray
 
+jit_message = deps.numba_import("the secondderivative module")
+
+if jit_message is None:
+    from ._secondderivative_numba import (
+        _matvec_backward_numba,
+        _matvec_centered_numba,
+        _matvec_forward_numba,
+        _rmatvec_backward_numba,
+        _rmatvec_centered_numba,
+        _rmatvec_forward_numba,
+    )
+
+logging.basicConfig(format="%(levelname)s: %(message)s", level=logging.WARNING)
+
+
+def _stencil(ncp, xl: NDArray, xc: NDArray, xr: NDArray, y: NDArray) -> None:
+    """Compute ``y = xl - 2 * xc + xr`` in-place in ``y`` (i.e., without
+    creating temporary arrays)"""
+    ncp.subtract(xr, xc, out=y)
+    ncp.subtract(y, xc, out=y)
+    ncp.add(y, xl, out=y)
+
 
 class SecondDerivative(LinearOperator):
     r"""Second derivative.
@@ -41,6 +64,12 @@ class SecondDerivative(LinearOperator):
         .. versionadded:: 2.0.0
 
         Name of operator (to be used by :func:`pylops.utils.describe.describe`)
+    engine : :obj:`str`, optional
+        .. versionadded:: 2.3.0
+
+        Engine used for computation (``numpy`` or ``numba``). Note that
+        ``numba`` can only be used with NumPy arrays, CuPy arrays
+        are always processed with the ``numpy`` engine.
 
     Attributes
     ----------
@@ -50,6 +79,16 @@ class SecondDerivative(LinearOperator):
         Operator contains a matrix that can be solved explicitly (``True``) or
         not (``False``)
 
+    Raises
+    ------
+    KeyError
+        If ``engine`` is neither ``numpy`` nor ``numba``
+    ValueError
+        If ``kind="centered"`` and ``edge=True`` and ``axis`` has less than
+        three samples
+    NotImplementedError
+        If ``kind`` is not ``forward``, ``centered``, or ``backward``
+
     Notes
     -----
     The SecondDerivative operator applies a second derivative to any chosen
@@ -73,6 +112,8 @@ class SecondDerivative(LinearOperator):
 
     """
 
+    _supports_out = True
+
     def __init__(
         self,
         dims: Union[int, InputDimsLike],
@@ -82,7 +123,14 @@ class SecondDerivative(LinearOperator):
         edge: bool = False,
         dtype: DTypeLike = "float64",
         name: str = "S",
+        engine: str = "numpy",
     ) -> None:
+        if engine not in ["numpy", "numba"]:
+            raise KeyError("engine must be numpy or numba")
+        if engine == "numba" and jit_message is not None:
+            logging.warning(jit_message)
+            engine = "numpy"
+
         dims = _value_or_sized_to_tuple(dims)
         super().__init__(dtype=np.dtype(dtype), dims=dims, dimsd=dims, name=name)
 
@@ -90,11 +138,33 @@ class SecondDerivative(LinearOperator):
         self.sampling = sampling
         self.kind = kind
         self.edge = edge
-        self._register_multiplications(self.kind)
+        self.engine = engine
+        # view of the input/output arrays as (n0, n, n1), with the derivative
+        # applied along the second axis (no copy is required for this reshape)
+        self._dims3 = (
+            int(np.prod(self.dims[: self.axis])),
+            self.dims[self.axis],
+            int(np.prod(self.dims[self.axis + 1 :])),
+        )
+        if self.kind == "centered" and self.edge and self._dims3[1] < 3:
+            raise ValueError("edge=True requires at least three samples along axis")
+        self._register_multiplications(self.kind, self.engine)
+
+    @property
+    def sampling(self) -> float:
+        return self._sampling
+
+    @sampling.setter
+    def sampling(self, samplingnew: float) -> None:
+        # precompute the inverse of the squared sampling such that the
+        # stencils are scaled by a multiplication instead of a division
+        self._sampling = samplingnew
+        self._inv_dx2 = float(1.0 / (samplingnew * samplingnew))
 
     def _register_multiplications(
         self,
         kind: str,
+        engine: str,
     ) -> None:
         # choose _matvec and _rmatvec kind
         self._hmatvec: Callable
@@ -112,73 +182,135 @@ class SecondDerivative(LinearOperator):
             raise NotImplementedError(
                 "'kind' must be 'forward', 'centered' or 'backward'"
             )
+        # choose numba kernels
+        self._nbmatvec: Callable
+        self._nbrmatvec: Callable
+        if engine == "numba":
+            if kind == "forward":
+                self._nbmatvec = _matvec_forward_numba
+                self._nbrmatvec = _rmatvec_forward_numba
+            elif kind == "centered":
+                self._nbmatvec = _matvec_centered_numba
+                self._nbrmatvec = _rmatvec_centered_numba
+            else:
+                self._nbmatvec = _matvec_backward_numba
+                self._nbrmatvec = _rmatvec_backward_numba
+
+    def _empty(self, ncp, out: Optional[NDArray] = None) -> NDArray:
+        # output array as (n0, n, n1) view, either newly allocated or
+        # provided by the caller (flattened and C-contiguous)
+        if out is None:
+            return ncp.empty(self._dims3, self.dtype)
+        return out.reshape(self._dims3)
+
+    def _zeros(self, x: NDArray, out: Optional[NDArray] = None) -> NDArray:
+        # output of stencils along an axis with less than three samples
+        # (none of the samples can be computed)
+        y = self._empty(get_array_module(x), out)
+        y[:] = 0
+        return y.ravel()
+
+    def _matvec(self, x: NDArray, out: Optional[NDArray] = None) -> NDArray:
+        if self._dims3[1] < 3:
+            return self._zeros(x, out=out)
+        if self.engine == "numba" and get_array_module(x) == np:
+            return self._matvec_numba(x, out=out)
+        return self._hmatvec(x, out=out)
 
-    def _matvec(self, x: NDArray) -> NDArray:
-        return self._hmatvec(x)
+    def _rmatvec(self, x: NDArray, out: Optional[NDArray] = None) -> NDArray:
+        if self._dims3[1] < 3:
+            return self._zeros(x, out=out)
+        if self.engine == "numba" and get_array_module(x) == np:
+            return self._rmatvec_numba(x, out=out)
+        return self._hrmatvec(x, out=out)
 
-    def _rmatvec(self, x: NDArray) -> NDArray:
-        return self._hrmatvec(x)
+    def _matvec_numba(self, x: NDArray, out: Optional[NDArray] = None) -> NDArray:
+        x = np.ascontiguousarray(x).reshape(self._dims3)
+        y = self._empty(np, out)
+        y = self._nbmatvec(x, y, self._inv_dx2, self.edge)
+        return y.ravel()
 
-    @reshaped(swapaxis=True)
-    def _matvec_forward(self, x: NDArray) -> NDArray:
+    def _rmatvec_numba(self, x: NDArray, out: Optional[NDArray] = None) -> NDArray:
+        x = np.ascontiguousarray(x).reshape(self._dims3)
+        y = self._empty(np, out)
+        y = self._nbrmatvec(x, y, self._inv_dx2, self.edge)
+        return y.ravel()
+
+    def _matvec_forward(self, x: NDArray, out: Optional[NDArray] = None) -> NDArray:
         ncp = get_array_module(x)
-        y = ncp.zeros(x.shape, self.dtype)
-        y[..., :-2] = x[..., 2:] - 2 * x[..., 1:-1] + x[..., :-2]
-        y /= self.sampling**2
-        return y
+        x = x.reshape(self._dims3)
+        y = self._empty(ncp, out)
+        _stencil(ncp, x[:, :-2], x[:, 1:-1], x[:, 2:], y[:, :-2])
+        y[:, -2:] = 0
+        y *= self._inv_dx2
+        return y.ravel()
 
-    @reshaped(swapaxis=True)
-    def _rmatvec_forward(self, x: NDArray) -> NDArray:
+    def _rmatvec_forward(self, x: NDArray, out: Optional[NDArray] = None) -> NDArray:
         ncp = get_array_module(x)
-        y = ncp.zeros(x.shape, self.dtype)
-        y[..., :-2] += x[..., :-2]
-        y[..., 1:-1] -= 2 * x[..., :-2]
-        y[..., 2:] += x[..., :-2]
-        y /= self.sampling**2
-        return y
-
-    @reshaped(swapaxis=True)
-    def _matvec_centered(self, x: NDArray) -> NDArray:
+        x = x.reshape(self._dims3)
+        y = self._empty(ncp, out)
+        _stencil(ncp, x[:, :-2], x[:, 1:-1], x[:, 2:], y[:, 2:])
+        y[:, 0] = x[:, 0]
+        y[:, 1] = x[:, 1] - 2 * x[:, 0]
+        # remove contributions of last two samples of x (unused in forward)
+        y[:, -1] = x[:, -3]
+        y[:, -2] -= x[:, -2]
+        y *= self._inv_dx2
+        return y.ravel()
+
+    def _matvec_centered(self, x: NDArray, out: Optional[NDArray] = None) -> NDArray:
         ncp = get_array_module(x)
-        y = ncp.zeros(x.shape, self.dtype)
-        y[..., 1:-1] = x[..., 2:] - 2 * x[..., 1:-1] + x[..., :-2]
+        x = x.reshape(self._dims3)
+        y = self._empty(ncp, out)
+        _stencil(ncp, x[:, :-2], x[:, 1:-1], x[:, 2:], y[:, 1:-1])
+        # edges (shifted stencils or zero)
         if self.edge:
-            y[..., 0] = x[..., 0] - 2 * x[..., 1] + x[..., 2]
-            y[..., -1] = x[..., -3] - 2 * x[..., -2] + x[..., -1]
-        y /= self.sampling**2
-        return y
+            _stencil(ncp, x[:, 0], x[:, 1], x[:, 2], y[:, 0])
+            _stencil(ncp, x[:, -3], x[:, -2], x[:, -1], y[:, -1])
+        else:
+            y[:, 0] = 0
+            y[:, -1] = 0
+        y *= self._inv_dx2
+        return y.ravel()
 
-    @reshaped(swapaxis=True)
-    def _rmatvec_centered(self, x: NDArray) -> NDArray:
+    def _rmatvec_centered(self, x: NDArray, out: Optional[NDArray] = None) -> NDArray:
         ncp = get_array_module(x)
-        y = ncp.zeros(x.shape, self.dtype)
-        y[..., :-2] += x[..., 1:-1]
-        y[..., 1:-1] -= 2 * x[..., 1:-1]
-        y[..., 2:] += x[..., 1:-1]
+        x = x.reshape(self._dims3)
+        y = self._empty(ncp, out)
+        _stencil(ncp, x[:, :-2], x[:, 1:-1], x[:, 2:], y[:, 1:-1])
+        # remove contributions of first and last samples of x (unused in forward)
+        y[:, 0] = x[:, 1]
+        y[:, -1] = x[:, -2]
+        y[:, 1] -= x[:, 0]
+        y[:, -2] -= x[:, -1]
         if self.edge:
-            y[..., 0] += x[..., 0]
-            y[..., 1] -= 2 * x[..., 0]
-            y[..., 2] += x[..., 0]
-            y[..., -3] += x[..., -1]
-            y[..., -2] -= 2 * x[..., -1]
-            y[..., -1] += x[..., -1]
-        y /= self.sampling**2
-        return y
-
-    @reshaped(swapaxis=True)
-    def _matvec_backward(self, x: NDArray) -> NDArray:
+            y[:, 0] += x[:, 0]
+            y[:, 1] -= 2 * x[:, 0]
+            y[:, 2] += x[:, 0]
+            y[:, -3] += x[:, -1]
+            y[:, -2] -= 2 * x[:, -1]
+            y[:, -1] += x[:, -1]
+        y *= self._inv_dx2
+        return y.ravel()
+
+    def _matvec_backward(self, x: NDArray, out: Optional[NDArray] = None) -> NDArray:
         ncp = get_array_module(x)
-        y = ncp.zeros(x.shape, self.dtype)
-        y[..., 2:] = x[..., 2:] - 2 * x[..., 1:-1] + x[..., :-2]
-        y /= self.sampling**2
-        return y
+        x = x.reshape(self._dims3)
+        y = self._empty(ncp, out)
+        _stencil(ncp, x[:, :-2], x[:, 1:-1], x[:, 2:], y[:, 2:])
+        y[:, :2] = 0
+        y *= self._inv_dx2
+        return y.ravel()
 
-    @reshaped(swapaxis=True)
-    def _rmatvec_backward(self, x: NDArray) -> NDArray:
+    def _rmatvec_backward(self, x: NDArray, out: Optional[NDArray] = None) -> NDArray:
         ncp = get_array_module(x)
-        y = ncp.zeros(x.shape, self.dtype)
-        y[..., :-2] += x[..., 2:]
-        y[..., 1:-1] -= 2 * x[..., 2:]
-        y[..., 2:] += x[..., 2:]
-        y /= self.sampling**2
-        return y
+        x = x.reshape(self._dims3)
+        y = self._empty(ncp, out)
+        _stencil(ncp, x[:, :-2], x[:, 1:-1], x[:, 2:], y[:, :-2])
+        y[:, -1] = x[:, -1]
+        y[:, -2] = x[:, -2] - 2 * x[:, -1]
+        # remove contributions of first two samples of x (unused in forward)
+        y[:, 0] = x[:, 2]
+        y[:, 1] -= x[:, 1]
+        y *= self._inv_dx2
+        return y.ravel()
@@ -106,6 +106,10 @@ class LinearOperator(_LinearOperator):
 
     """
 
+    # whether ``_matvec`` and ``_rmatvec`` accept an ``out`` keyword argument
+    # to write their result directly into a preallocated array
+    _supports_out: bool = False
+
     def __init__(
         self,
         Op: Optional[Union[spLinearOperator, LinearOperator]] = None,
@@ -554,6 +558,82 @@ class LinearOperator(_LinearOperator):
             raise ValueError("invalid shape returned by user-defined rmatvec()")
         return y
 
+    @count(forward=True)
+    def matvec_into(self, x: NDArray, out: NDArray) -> NDArray:
+        """Matrix-vector multiplication into a preallocated array.
+
+        Operators that support it write the result directly into ``out``
+        (avoiding the allocation of a new array at every call), whilst for
+        all other operators the result is copied into ``out``. When ``out``
+        may overlap with ``x``, the result is also computed into a new array
+        and then copied into ``out``.
+
+        .. versionadded:: 2.3.0
+
+        Parameters
+        ----------
+        x : :obj:`numpy.ndarray`
+            Input array of shape (N,)
+        out : :obj:`numpy.ndarray`
+            Contiguous output array of shape (M,)
+
+        Returns
+        -------
+        out : :obj:`numpy.ndarray`
+            Output array of shape (M,)
+
+        """
+        M, N = self.shape
+
+        if x.shape != (N,) or out.shape != (M,):
+            raise ValueError("dimension mismatch")
+
+        ncp = get_array_module(x)
+        if self._supports_out and not ncp.may_share_memory(x, out):
+            # operators with _supports_out=True accept the out keyword argument
+            self._matvec(x, out=out)  # type: ignore[call-arg]
+        else:
+            out[:] = self._matvec(x).reshape(M)
+        return out
+
+    @count(forward=False)
+    def rmatvec_into(self, x: NDArray, out: NDArray) -> NDArray:
+        """Adjoint matrix-vector multiplication into a preallocated array.
+
+        Operators that support it write the result directly into ``out``
+        (avoiding the allocation of a new array at every call), whilst for
+        all other operators the result is copied into ``out``. When ``out``
+        may overlap with ``x``, the result is also computed into a new array
+        and then copied into ``out``.
+
+        .. versionadded:: 2.3.0
+
+        Parameters
+        ----------
+        x : :obj:`numpy.ndarray`
+            Input array of shape (M,)
+        out : :obj:`numpy.ndarray`
+            Contiguous output array of shape (N,)
+
+        Returns
+        -------
+        out : :obj:`numpy.ndarray`
+            Output array of shape (N,)
+
+        """
+        M, N = self.shape
+
+        if x.shape != (M,) or out.shape != (N,):
+            raise ValueError("dimension mismatch")
+
+        ncp = get_array_module(x)
+        if self._supports_out and not ncp.may_share_memory(x, out):
+            # operators with _supports_out=True accept the out keyword argument
+            self._rmatvec(x, out=out)  # type: ignore[call-arg]
+        else:
+            out[:] = self._rmatvec(x).reshape(N)
+        return out
+
     @count(forward=True, matmat=True)
     def matmat(self, X: NDArray) -> NDArray:
         """Matrix-matrix multiplication.
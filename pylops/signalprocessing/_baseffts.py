@@ -222,6 +222,14 @@ class _BaseFFTND(LinearOperator):
                 f"if this is the required behaviour ignore this message."
             )
 
+        # Check if the user provided nfft larger than n. If so, set a flag such
+        # that the output of the ifft is cropped to the original size. The
+        # cropping is done by slicing (returns a view) along all axes at once
+        self.doifftcrop = any(
+            nfft > dims[direction] for direction, nfft in zip(self.axes, self.nffts)
+        )
+        self.ifftcrop = tuple(slice(0, dim) for dim in dims)
+
         if norm == "ortho":
             self.norm = _FFTNorms.ORTHO
         elif norm == "none":
@@ -262,6 +270,17 @@ class _BaseFFTND(LinearOperator):
                 )
                 fs[-1] = np.fft.fftshift(fs[-1])
         self.fs = tuple(fs)
+
+        # Slice of the frequencies along the last axis in ``axes`` that are
+        # scaled by sqrt(2) in forward mode (and 1/sqrt(2) in adjoint mode)
+        # when real=True (i.e., all frequencies except zero and Nyquist).
+        # This is applied in-place directly along ``axes[-1]`` (a Python float
+        # is used for the scaling factor so that it works with any backend)
+        self._sqrt2 = float(np.sqrt(2))
+        rfftslice = [slice(None)] * self.ndim
+        rfftslice[self.axes[-1]] = slice(1, 1 + (self.nffts[-1] - 1) // 2)
+        self.rfftslice = tuple(rfftslice)
+
         dimsd = np.array(dims)
         dimsd[self.axes] = self.nffts
         if self.real:
@@ -0,0 +1,45 @@
+import os
+from math import pi, sin
+
+from numba import jit, prange
+
+# detect whether to use parallel or not
+numba_threads = int(os.getenv("NUMBA_NUM_THREADS", "1"))
+parallel = True if numba_threads != 1 else False
+
+
+@jit(nopython=True, fastmath=True, nogil=True)
+def _sinc_numba(x):
+    """Normalized sinc function (equivalent to :func:`numpy.sinc`)"""
+    if x == 0.0:
+        return 1.0
+    x = pi * x
+    return sin(x) / x
+
+
+@jit(nopython=True, fastmath=True, nogil=True, parallel=parallel)
+def _predict_trace_numba(trace, t, newt, dt, tracenew):
+    """numba implementation of forward mode of slope-based trace prediction.
+    Refer to ``_predict_trace`` for full documentation.
+    """
+    nt = t.size
+    for j in prange(nt):
+        tmp = trace[0] * 0
+        for i in range(nt):
+            tmp += trace[i] * _sinc_numba((newt[j] - t[i]) / dt)
+        tracenew[j] = tmp
+    return tracenew
+
+
+@jit(nopython=True, fastmath=True, nogil=True, parallel=parallel)
+def _predict_trace_adj_numba(trace, t, newt, dt, tracenew):
+    """numba implementation of adjoint mode of slope-based trace prediction.
+    Refer to ``_predict_trace`` for full documentation.
+    """
+    nt = t.size
+    for i in prange(nt):
+        tmp = trace[0] * 0
+        for j in range(nt):
+            tmp += trace[j] * _sinc_numba((newt[j] - t[i]) / dt)
+        tracenew[i] = tmp
+    return tracenew
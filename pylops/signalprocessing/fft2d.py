@@ -9,14 +9,33 @@ import scipy.fft
 
 from pylops import LinearOperator
 from pylops.signalprocessing._baseffts import _BaseFFTND, _FFTNorms
+from pylops.utils import deps
+from pylops.utils.backend import get_array_module
 from pylops.utils.decorators import reshaped
-from pylops.utils.typing import DTypeLike, InputDimsLike
+from pylops.utils.typing import DTypeLike, InputDimsLike, NDArray
+
+pyfftw_message = deps.pyfftw_import("the fft2d module")
+
+if pyfftw_message is None:
+    import pyfftw
 
 logging.basicConfig(format="%(levelname)s: %(message)s", level=logging.WARNING)
 
 
+def _copyto_out(y: NDArray, out: Optional[NDArray] = None) -> NDArray:
+    """Copy ``y`` into the flattened array ``out`` (when provided) and return
+    a view of ``out`` with the same shape of ``y``"""
+    if out is None:
+        return y
+    yout = out.reshape(y.shape)
+    yout[...] = y
+    return yout
+
+
 class _FFT2D_numpy(_BaseFFTND):
-    """Two dimensional Fast-Fourier Transform using NumPy"""
+    """Two dimensional Fast-Fourier Transform using NumPy (or CuPy)"""
+
+    _supports_out = True
 
     def __init__(
         self,
@@ -66,53 +85,49 @@ class _FFT2D_numpy(_BaseFFTND):
             self._scale = 1.0 / np.prod(self.nffts)
 
     @reshaped
-    def _matvec(self, x):
+    def _matvec(self, x, out=None):
+        ncp = get_array_module(x)
         if self.ifftshift_before.any():
-            x = np.fft.ifftshift(x, axes=self.axes[self.ifftshift_before])
+            x = ncp.fft.ifftshift(x, axes=self.axes[self.ifftshift_before])
         if not self.clinear:
-            x = np.real(x)
+            x = ncp.real(x)
         if self.real:
-            y = np.fft.rfft2(x, s=self.nffts, axes=self.axes, **self._norm_kwargs)
+            y = ncp.fft.rfft2(x, s=self.nffts, axes=self.axes, **self._norm_kwargs)
             # Apply scaling to obtain a correct adjoint for this operator
-            y = np.swapaxes(y, -1, self.axes[-1])
-            y[..., 1 : 1 + (self.nffts[-1] - 1) // 2] *= np.sqrt(2)
-            y = np.swapaxes(y, self.axes[-1], -1)
+            y[self.rfftslice] *= self._sqrt2
         else:
-            y = np.fft.fft2(x, s=self.nffts, axes=self.axes, **self._norm_kwargs)
+            y = ncp.fft.fft2(x, s=self.nffts, axes=self.axes, **self._norm_kwargs)
         if self.norm is _FFTNorms.ONE_OVER_N:
             y *= self._scale
-        y = y.astype(self.cdtype)
+        y = y.astype(self.cdtype, copy=False)
         if self.fftshift_after.any():
-            y = np.fft.fftshift(y, axes=self.axes[self.fftshift_after])
-        return y
+            y = ncp.fft.fftshift(y, axes=self.axes[self.fftshift_after])
+        return _copyto_out(y, out)
 
     @reshaped
-    def _rmatvec(self, x):
+    def _rmatvec(self, x, out=None):
+        ncp = get_array_module(x)
         if self.fftshift_after.any():
-            x = np.fft.ifftshift(x, axes=self.axes[self.fftshift_after])
+            x = ncp.fft.ifftshift(x, axes=self.axes[self.fftshift_after])
         if self.real:
             # Apply scaling to obtain a correct adjoint for this operator
             x = x.copy()
-            x = np.swapaxes(x, -1, self.axes[-1])
-            x[..., 1 : 1 + (self.nffts[-1] - 1) // 2] /= np.sqrt(2)
-            x = np.swapaxes(x, self.axes[-1], -1)
-            y = np.fft.irfft2(x, s=self.nffts, axes=self.axes, **self._norm_kwargs)
+            x[self.rfftslice] /= self._sqrt2
+            y = ncp.fft.irfft2(x, s=self.nffts, axes=self.axes, **self._norm_kwargs)
         else:
-            y = np.fft.ifft2(x, s=self.nffts, axes=self.axes, **self._norm_kwargs)
+            y = ncp.fft.ifft2(x, s=self.nffts, axes=self.axes, **self._norm_kwargs)
         if self.norm is _FFTNorms.NONE:
             y *= self._scale
-        if self.nffts[0] > self.dims[self.axes[0]]:
-            y = np.take(y, range(self.dims[self.axes[0]]), axis=self.axes[0])
-        if self.nffts[1] > self.dims[self.axes[1]]:
-            y = np.take(y, range(self.dims[self.axes[1]]), axis=self.axes[1])
+        if self.doifftcrop:
+            y = y[self.ifftcrop]
         if self.doifftpad:
-            y = np.pad(y, self.ifftpad)
+            y = ncp.pad(y, self.ifftpad)
         if not self.clinear:
-            y = np.real(y)
-        y = y.astype(self.rdtype)
+            y = ncp.real(y)
+        y = y.astype(self.rdtype, copy=False)
         if self.ifftshift_before.any():
-            y = np.fft.fftshift(y, axes=self.axes[self.ifftshift_before])
-        return y
+            y = ncp.fft.fftshift(y, axes=self.axes[self.ifftshift_before])
+        return _copyto_out(y, out)
 
     def __truediv__(self, y):
         if self.norm is not _FFTNorms.ORTHO:
@@ -123,6 +138,8 @@ class _FFT2D_numpy(_BaseFFTND):
 class _FFT2D_scipy(_BaseFFTND):
     """Two dimensional Fast-Fourier Transform using SciPy"""
 
+    _supports_out = True
+
     def __init__(
         self,
         dims: InputDimsLike,
@@ -134,7 +151,29 @@ class _FFT2D_scipy(_BaseFFTND):
         ifftshift_before: bool = False,
         fftshift_after: bool = False,
         dtype: DTypeLike = "complex128",
+        workers: Optional[int] = None,
+        precision: str = "auto",
     ) -> None:
+        # working precision (the input is cast before the transform, and the
+        # transform is computed natively in such precision by scipy.fft): the
+        # dtype of the operator is set accordingly (precision is validated
+        # by FFT2D)
+        self._work_rdtype: Optional[np.dtype] = None
+        self._work_cdtype: Optional[np.dtype] = None
+        if precision == "single":
+            self._work_rdtype = np.dtype(np.float32)
+            self._work_cdtype = np.dtype(np.complex64)
+        elif precision == "double":
+            self._work_rdtype = np.dtype(np.float64)
+            self._work_cdtype = np.dtype(np.complex128)
+        self.precision = precision
+        if self._work_cdtype is not None:
+            dtype = (
+                self._work_rdtype
+                if np.issubdtype(dtype, np.floating)
+                else self._work_cdtype
+            )
+
         super().__init__(
             dims=dims,
             axes=axes,
@@ -155,6 +194,7 @@ class _FFT2D_scipy(_BaseFFTND):
 
         self.f1, self.f2 = self.fs
         del self.fs
+        self.workers = workers
 
         self._norm_kwargs: Dict[str, Union[None, str]] = {
             "norm": None
@@ -167,47 +207,74 @@ class _FFT2D_scipy(_BaseFFTND):
             self._scale = np.sqrt(1.0 / np.prod(self.nffts))
 
     @reshaped
-    def _matvec(self, x):
+    def _matvec(self, x, out=None):
         if self.ifftshift_before.any():
             x = scipy.fft.ifftshift(x, axes=self.axes[self.ifftshift_before])
         if not self.clinear:
             x = np.real(x)
+        if self._work_cdtype is not None:
+            x = x.astype(
+                self._work_cdtype if np.iscomplexobj(x) else self._work_rdtype,
+                copy=False,
+            )
         if self.real:
-            y = scipy.fft.rfft2(x, s=self.nffts, axes=self.axes, **self._norm_kwargs)
+            y = scipy.fft.rfft2(
+                x,
+                s=self.nffts,
+                axes=self.axes,
+                workers=self.workers,
+                **self._norm_kwargs,
+            )
             # Apply scaling to obtain a correct adjoint for this operator
-            y = np.swapaxes(y, -1, self.axes[-1])
-            y[..., 1 : 1 + (self.nffts[-1] - 1) // 2] *= np.sqrt(2)
-            y = np.swapaxes(y, self.axes[-1], -1)
+            y[self.rfftslice] *= self._sqrt2
         else:
-            y = scipy.fft.fft2(x, s=self.nffts, axes=self.axes, **self._norm_kwargs)
+            y = scipy.fft.fft2(
+                x,
+                s=self.nffts,
+                axes=self.axes,
+                workers=self.workers,
+                **self._norm_kwargs,
+            )
         if self.norm is _FFTNorms.ONE_OVER_N:
             y *= self._scale
         if self.fftshift_after.any():
             y = scipy.fft.fftshift(y, axes=self.axes[self.fftshift_after])
-        return y
+        return _copyto_out(y, out)
 
     @reshaped
-    def _rmatvec(self, x):
+    def _rmatvec(self, x, out=None):
         if self.fftshift_after.any():
             x = scipy.fft.ifftshift(x, axes=self.axes[self.fftshift_after])
+        if self._work_cdtype is not None:
+            x = x.astype(self._work_cdtype, copy=False)
         if self.real:
             # Apply scaling to obtain a correct adjoint for this operator
             x = x.copy()
-            x = np.swapaxes(x, -1, self.axes[-1])
-            x[..., 1 : 1 + (self.nffts[-1] - 1) // 2] /= np.sqrt(2)
-            x = np.swapaxes(x, self.axes[-1], -1)
-            y = scipy.fft.irfft2(x, s=self.nffts, axes=self.axes, **self._norm_kwargs)
+            x[self.rfftslice] /= self._sqrt2
+            y = scipy.fft.irfft2(
+                x,
+                s=self.nffts,
+                axes=self.axes,
+                workers=self.workers,
+                **self._norm_kwargs,
+            )
         else:
-            y = scipy.fft.ifft2(x, s=self.nffts, axes=self.axes, **self._norm_kwargs)
+            y = scipy.fft.ifft2(
+                x,
+                s=self.nffts,
+                axes=self.axes,
+                workers=self.workers,
+                **self._norm_kwargs,
+            )
         if self.norm is _FFTNorms.NONE:
             y *= self._scale
-        y = np.take(y, range(self.dims[self.axes[0]]), axis=self.axes[0])
-        y = np.take(y, range(self.dims[self.axes[1]]), axis=self.axes[1])
+        if self.doifftcrop:
+            y = y[self.ifftcrop]
         if not self.clinear:
             y = np.real(y)
         if self.ifftshift_before.any():
             y = scipy.fft.fftshift(y, axes=self.axes[self.ifftshift_before])
-        return y
+        return _copyto_out(y, out)
 
     def __truediv__(self, y):
         if self.norm is not _FFTNorms.ORTHO:
@@ -215,6 +282,179 @@ class _FFT2D_scipy(_BaseFFTND):
         return self._rmatvec(y)
 
 
+class _FFT2D_fftw(_BaseFFTND):
+    """Two dimensional Fast-Fourier Transform using pyFFTW"""
+
+    _supports_out = True
+
+    def __init__(
+        self,
+        dims: InputDimsLike,
+        axes: InputDimsLike = (-2, -1),
+        nffts: Optional[Union[int, InputDimsLike]] = None,
+        sampling: Union[float, Sequence[float]] = 1.0,
+        norm: str = "ortho",
+        real: bool = False,
+        ifftshift_before: bool = False,
+        fftshift_after: bool = False,
+        dtype: DTypeLike = "complex128",
+        **kwargs_fftw,
+    ) -> None:
+        if np.dtype(dtype) == np.float16:
+            warnings.warn(
+                "fftw backend is unavailable with float16 dtype. Will use float32."
+            )
+            dtype = np.float32
+
+        for badop in ["ortho", "normalise_idft"]:
+            if badop in kwargs_fftw:
+                if badop == "ortho" and norm == "ortho":
+                    continue
+                warnings.warn(
+                    f"FFTW option '{badop}' will be overwritten by norm={norm}"
+                )
+                del kwargs_fftw[badop]
+
+        super().__init__(
+            dims=dims,
+            axes=axes,
+            nffts=nffts,
+            sampling=sampling,
+            norm=norm,
+            real=real,
+            ifftshift_before=ifftshift_before,
+            fftshift_after=fftshift_after,
+            dtype=dtype,
+        )
+
+        # checks
+        if self.ndim < 2:
+            raise ValueError("FFT2D requires at least two input dimensions")
+        if self.naxes != 2:
+            raise ValueError("FFT2D must be applied along exactly two dimensions")
+
+        self.f1, self.f2 = self.fs
+        del self.fs
+
+        dims_t = list(self.dims)
+        for direction, nfft in zip(self.axes, self.nffts):
+            dims_t[direction] = nfft
+        self.dims_t = dims_t
+
+        # define padding and cropping (fftw requires the user to provide
+        # an input signal of the same size of the transform)
+        self.pad = np.zeros((self.ndim, 2), dtype=int)
+        self.crop = [slice(None)] * self.ndim
+        for direction, nfft in zip(self.axes, self.nffts):
+            if nfft > self.dims[direction]:
+                self.pad[direction, 1] = nfft - self.dims[direction]
+            else:
+                self.crop[direction] = slice(0, nfft)
+        self.dopad = True if np.sum(self.pad) > 0 else False
+        self.crop = tuple(self.crop)
+
+        # create empty arrays and plans for fft/ifft. Plans are created
+        # only once here and re-used at every call of matvec/rmatvec
+        self.x = pyfftw.empty_aligned(
+            self.dims_t, dtype=self.rdtype if real else self.cdtype
+        )
+        self.y = pyfftw.empty_aligned(self.dimsd, dtype=self.cdtype)
+
+        # Use FFTW without norm-related keywords above. In this case, FFTW standard
+        # behavior is to scale with 1/N on the inverse transform. The _scale below
+        # converts the default bevavior to that of ``norm``.
+        nfft = np.prod(self.nffts)
+        if self.norm is _FFTNorms.ORTHO:
+            self._scale = np.sqrt(1.0 / nfft)
+        elif self.norm is _FFTNorms.NONE:
+            self._scale = nfft
+        elif self.norm is _FFTNorms.ONE_OVER_N:
+            self._scale = 1.0 / nfft
+
+        self.fftplan = pyfftw.FFTW(
+            self.x,
+            self.y,
+            axes=tuple(self.axes),
+            direction="FFTW_FORWARD",
+            **kwargs_fftw,
+        )
+        self.ifftplan = pyfftw.FFTW(
+            self.y,
+            self.x,
+            axes=tuple(self.axes),
+            direction="FFTW_BACKWARD",
+            **kwargs_fftw,
+        )
+
+    @reshaped
+    def _matvec(self, x, out=None):
+        if self.ifftshift_before.any():
+            x = np.fft.ifftshift(x, axes=self.axes[self.ifftshift_before])
+        if not self.clinear:
+            x = np.real(x)
+        if self.doifftpad:
+            x = x[self.crop]
+        if self.dopad:
+            x = np.pad(x, self.pad, "constant", constant_values=0)
+
+        # self.fftplan() always uses byte-alligned self.x as input array and
+        # returns self.y as output array. As such, self.x must be copied so as
+        # not to be overwritten on a subsequent call to _matvec.
+        np.copyto(self.x, x)
+        y = self.fftplan()
+        y = y.copy() if out is None else _copyto_out(y, out)
+        if self.norm is not _FFTNorms.NONE:
+            y *= self._scale
+
+        if self.real:
+            # Apply scaling to obtain a correct adjoint for this operator
+            y[self.rfftslice] *= self._sqrt2
+        if self.fftshift_after.any():
+            y = _copyto_out(
+                np.fft.fftshift(y, axes=self.axes[self.fftshift_after]), out
+            )
+        return y
+
+    @reshaped
+    def _rmatvec(self, x, out=None):
+        if self.fftshift_after.any():
+            x = np.fft.ifftshift(x, axes=self.axes[self.fftshift_after])
+
+        # self.ifftplan() always uses byte-alligned self.y as input array.
+        # We copy here so we don't need to copy again in the case of `real=True`,
+        # which only performs operations that preserve byte-allignment.
+        np.copyto(self.y, x)
+        x = self.y  # Update reference only
+
+        if self.real:
+            # Apply scaling to obtain a correct adjoint for this operator
+            x[self.rfftslice] /= self._sqrt2
+
+        # self.ifftplan() always returns self.x, which must be copied so as not
+        # to be overwritten on a subsequent call to _rmatvec.
+        y = self.ifftplan().copy()
+        if self.norm is _FFTNorms.ORTHO:
+            y /= self._scale
+        elif self.norm is _FFTNorms.NONE:
+            y *= self._scale
+
+        if self.doifftcrop:
+            y = y[self.ifftcrop]
+        if self.doifftpad:
+            y = np.pad(y, self.ifftpad)
+
+        if self.ifftshift_before.any():
+            y = np.fft.fftshift(y, axes=self.axes[self.ifftshift_before])
+        if not self.clinear:
+            y = np.real(y)
+        return _copyto_out(y, out)
+
+    def __truediv__(self, y):
+        if self.norm is _FFTNorms.ORTHO:
+            return self._rmatvec(y)
+        return self._rmatvec(y) / self._scale
+
+
 def FFT2D(
     dims: InputDimsLike,
     axes: InputDimsLike = (-2, -1),
@@ -227,6 +467,9 @@ def FFT2D(
     engine: str = "numpy",
     dtype: DTypeLike = "complex128",
     name: str = "F",
+    workers: Optional[int] = None,
+    precision: str = "auto",
+    **kwargs_fftw,
 ) -> LinearOperator:
     r"""Two dimensional Fast-Fourier Transform.
 
@@ -237,6 +480,9 @@ def FFT2D(
     :py:func:`numpy.fft.fft2` (or :py:func:`numpy.fft.rfft2` for real models) in
     forward mode, and to :py:func:`numpy.fft.ifft2` (or :py:func:`numpy.fft.irfft2`
     for real models) in adjoint mode, or their CuPy equivalents.
+    When ``engine='fftw'`` is chosen, the :py:class:`pyfftw.FFTW` class is used
+    instead: the FFTW plans for the forward and adjoint transforms are created
+    once when the operator is instantiated and re-used at every application.
     Alternatively, when the SciPy engine is chosen, the overloads are of
     :py:func:`scipy.fft.fft2` (or :py:func:`scipy.fft.rfft2` for real models) in
     forward mode, and to :py:func:`scipy.fft.ifft2` (or :py:func:`scipy.fft.irfft2`
@@ -310,7 +556,10 @@ def FFT2D(
     engine : :obj:`str`, optional
         .. versionadded:: 1.17.0
 
-        Engine used for fft computation (``numpy`` or ``scipy``).
+        Engine used for fft computation (``numpy``, ``fftw``, or ``scipy``).
+
+        .. note:: Since version 2.3.0, accepts "fftw".
+
     dtype : :obj:`str`, optional
         Type of elements in input array. Note that the ``dtype`` of the operator
         is the corresponding complex type even when a real type is provided.
@@ -324,6 +573,29 @@ def FFT2D(
         .. versionadded:: 2.0.0
 
         Name of operator (to be used by :func:`pylops.utils.describe.describe`)
+    workers : :obj:`int`, optional
+        .. versionadded:: 2.3.0
+
+        Maximum number of workers to use for parallel computation when
+        ``engine='scipy'`` (see :py:func:`scipy.fft.fft2`). If negative, the
+        value wraps around from ``os.cpu_count()``, e.g., ``workers=-1`` uses
+        all available cores. For ``engine='fftw'``, use ``threads`` in ``**kwargs_fftw`` instead.
+        Ignored (with a warning) by the other engines.
+    precision : :obj:`str`, optional
+        .. versionadded:: 2.3.0
+
+        Working precision of the transforms when ``engine='scipy'``: ``auto``
+        (precision of the input), ``single`` (input cast to single precision)
+        or ``double`` (input cast to double precision). With ``single``, the
+        transforms move half of the data compared to ``double`` and are
+        usually faster on large inputs, at the price of a relative accuracy of
+        about :math:`10^{-6}` (which is often sufficient within iterative
+        solvers). Note that ``dtype`` is overridden by the working precision
+        when ``single`` or ``double`` is chosen. Ignored (with a warning) by
+        the other engines.
+    **kwargs_fftw
+            Arbitrary keyword arguments
+            for :py:class:`pyfftw.FTTW`
 
     Attributes
     ----------
@@ -360,8 +632,9 @@ def FFT2D(
         - If ``nffts`` or ``sampling`` are not either a single value or a tuple with
           two elements.
         - If ``norm`` is not one of "ortho", "none", or "1/n".
+        - If ``precision`` is not one of "auto", "single", or "double".
     NotImplementedError
-        If ``engine`` is neither ``numpy``, nor ``scipy``.
+        If ``engine`` is neither ``numpy``, ``fftw``, nor ``scipy``.
 
     See Also
     --------
@@ -394,7 +667,29 @@ def FFT2D(
     signals.
 
     """
-    if engine == "numpy":
+    if precision not in ["auto", "single", "double"]:
+        raise ValueError("precision must be auto, single or double")
+    if engine != "scipy" and (precision != "auto" or workers is not None):
+        logging.warning(
+            "workers and precision are only used when engine='scipy', ignoring them"
+        )
+
+    if engine == "fftw" and pyfftw_message is None:
+        f = _FFT2D_fftw(
+            dims=dims,
+            axes=axes,
+            nffts=nffts,
+            sampling=sampling,
+            norm=norm,
+            real=real,
+            ifftshift_before=ifftshift_before,
+            fftshift_after=fftshift_after,
+            dtype=dtype,
+            **kwargs_fftw,
+        )
+    elif engine == "numpy" or (engine == "fftw" and pyfftw_message is not None):
+        if engine == "fftw" and pyfftw_message is not None:
+            logging.warning(pyfftw_message)
         f = _FFT2D_numpy(
             dims=dims,
             axes=axes,
@@ -417,8 +712,10 @@ def FFT2D(
             ifftshift_before=ifftshift_before,
             fftshift_after=fftshift_after,
             dtype=dtype,
+            workers=workers,
+            precision=precision,
         )
     else:
-        raise NotImplementedError("engine must be numpy or scipy")
+        raise NotImplementedError("engine must be numpy, fftw or scipy")
     f.name = name
     return f
@@ -1,5 +1,7 @@
 __all__ = ["Seislet"]
 
+import logging
+from functools import partial
 from math import ceil, log
 from typing import Optional, Sequence
 
@@ -7,8 +9,16 @@ import numpy as np
 
 from pylops import LinearOperator
 from pylops.basicoperators import Pad
+from pylops.utils import deps
 from pylops.utils.typing import DTypeLike, NDArray
 
+jit_message = deps.numba_import("the seislet module")
+
+if jit_message is None:
+    from ._seislet_numba import _predict_trace_adj_numba, _predict_trace_numba
+
+logging.basicConfig(format="%(levelname)s: %(message)s", level=logging.WARNING)
+
 
 def _predict_trace(
     trace: NDArray,
@@ -17,6 +27,7 @@ def _predict_trace(
     dx: float,
     slope: NDArray,
     adj: bool = False,
+    engine: str = "numpy",
 ) -> NDArray:
     r"""Slope-based trace prediction.
 
@@ -26,6 +37,9 @@ def _predict_trace(
 
     The input trace is interpolated using sinc-interpolation to a new time
     axis given by the following formula: :math:`t_{new} = t - dx*s(t)`.
+    With ``engine="numba"``, the interpolation is computed on-the-fly by a
+    compiled kernel instead of explicitly creating the sinc-interpolation
+    matrix.
 
     Parameters
     ----------
@@ -41,6 +55,8 @@ def _predict_trace(
         Slope field
     adj : :obj:`bool`, optional
         Perform forward (``False``) or adjoint (``True``) operation
+    engine : :obj:`str`, optional
+        Engine used for computation (``numpy`` or ``numba``)
 
     Returns
     -------
@@ -49,6 +65,11 @@ def _predict_trace(
 
     """
     newt = t - dx * slope
+    if engine == "numba":
+        tracenew = np.empty(len(newt), dtype=np.result_type(trace, newt))
+        if adj:
+            return _predict_trace_adj_numba(trace, t, newt, dt, tracenew)
+        return _predict_trace_numba(trace, t, newt, dt, tracenew)
     sinc = np.tile(newt, (len(newt), 1)) - np.tile(t[:, np.newaxis], (1, len(newt)))
     if adj:
         tracenew = np.dot(trace, np.sinc(sinc / dt).T)
@@ -65,6 +86,7 @@ def _predict_haar(
     repeat: int = 0,
     backward: bool = False,
     adj: bool = False,
+    engine: str = "numpy",
 ) -> NDArray:
     """Predict set of traces given time-varying slopes (Haar basis function)
 
@@ -93,6 +115,8 @@ def _predict_haar(
         of input trace
     adj : :obj:`bool`, optional
         Perform forward (``False``) or adjoint (``True``) operation
+    engine : :obj:`str`, optional
+        Engine used for computation (``numpy`` or ``numba``)
 
     Returns
     -------
@@ -123,6 +147,7 @@ def _predict_haar(
                     idir * dx,
                     slopes[ix * slopejump + iback * repeat + idir * irepeat],
                     adj=True,
+                    engine=engine,
                 )
         else:
             for irepeat in range(repeat):
@@ -132,6 +157,7 @@ def _predict_haar(
                     dt,
                     idir * dx,
                     slopes[ix * slopejump + iback * repeat + idir * irepeat],
+                    engine=engine,
                 )
         pred[ix] = pred_tmp
     return pred
@@ -145,6 +171,7 @@ def _predict_lin(
     repeat: int = 0,
     backward: bool = False,
     adj: bool = False,
+    engine: str = "numpy",
 ) -> NDArray:
     """Predict set of traces given time-varying slopes (Linear basis function)
 
@@ -176,6 +203,7 @@ def _predict_lin(
                         idir * dx,
                         slopes[ix * slopejump + iback * repeat + idir * irepeat],
                         adj=True,
+                        engine=engine,
                     )
                     pred_tmp1 = 0
                 else:
@@ -186,6 +214,7 @@ def _predict_lin(
                         idir * dx,
                         slopes[ix * slopejump + iback * repeat + idir * irepeat],
                         adj=True,
+                        engine=engine,
                     )
                     pred_tmp1 = _predict_trace(
                         pred_tmp1,
@@ -194,6 +223,7 @@ def _predict_lin(
                         (-idir) * dx,
                         slopes[ix * slopejump + iback * repeat - idir * irepeat],
                         adj=True,
+                        engine=engine,
                     )
         else:
             if not ((ix == nx - 1 and not backward) or (ix == 0 and backward)):
@@ -206,6 +236,7 @@ def _predict_lin(
                         dt,
                         idir * dx,
                         slopes[ix * slopejump + iback * repeat + idir * irepeat],
+                        engine=engine,
                     )
                     pred_tmp1 = 0
                 else:
@@ -215,6 +246,7 @@ def _predict_lin(
                         dt,
                         idir * dx,
                         slopes[ix * slopejump + iback * repeat + idir * irepeat],
+                        engine=engine,
                     )
                     pred_tmp1 = _predict_trace(
                         pred_tmp1,
@@ -224,6 +256,7 @@ def _predict_lin(
                         slopes[
                             (ix + idir) * slopejump + iback * repeat - idir * irepeat
                         ],
+                        engine=engine,
                     )
 
         # if (adj and ((ix == 0 and not backward) or (ix == nx - 1 and backward))) or
@@ -270,6 +303,10 @@ class Seislet(LinearOperator):
         .. versionadded:: 2.0.0
 
         Name of operator (to be used by :func:`pylops.utils.describe.describe`)
+    engine : :obj:`str`, optional
+        .. versionadded:: 2.3.0
+
+        Engine used for the slope-based predictions (``numpy`` or ``numba``)
 
     Attributes
     ----------
@@ -281,6 +318,8 @@ class Seislet(LinearOperator):
 
     Raises
     ------
+    KeyError
+        If ``engine`` is neither ``numpy`` nor ``numba``
     NotImplementedError
         If ``kind`` is different from haar or linear
     ValueError
@@ -405,15 +444,21 @@ class Seislet(LinearOperator):
         inv: bool = False,
         dtype: DTypeLike = "float64",
         name: str = "S",
+        engine: str = "numpy",
     ) -> None:
         if len(sampling) != 2:
             raise ValueError("provide two sampling steps")
+        if engine not in ["numpy", "numba"]:
+            raise KeyError("engine must be numpy or numba")
+        if engine == "numba" and jit_message is not None:
+            logging.warning(jit_message)
+            engine = "numpy"
 
         # define predict and update steps
         if kind == "haar":
-            self.predict = _predict_haar
+            self.predict = partial(_predict_haar, engine=engine)
         elif kind == "linear":
-            self.predict = _predict_lin
+            self.predict = partial(_predict_lin, engine=engine)
         else:
             raise NotImplementedError("kind should be haar or linear")
 
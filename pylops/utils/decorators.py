@@ -122,6 +122,9 @@ def reshaped(
             y = do_things_to_reshaped(y)
             return y
 
+    Keyword arguments (e.g., ``out``) are passed unchanged to the decorated
+    function.
+
     """
 
     def decorator(f):
@@ -136,11 +139,11 @@ def reshaped(
         inp_dims = "dims" if fwd else "dimsd"
 
         @wraps(f)
-        def wrapper(self, x):
+        def wrapper(self, x, **kwargs):
             x = x.reshape(getattr(self, inp_dims))
             if swapaxis:
                 x = x.swapaxes(self.axis, -1)
-            y = f(self, x)
+            y = f(self, x, **kwargs)
             if swapaxis:
                 y = y.swapaxes(self.axis, -1)
             y = y.ravel()
@@ -186,9 +189,9 @@ def count(
             mat = matmat
 
         @wraps(f)
-        def wrapper(self, x):
+        def wrapper(self, x, *args, **kwargs):
             # perform operation
-            y = f(self, x)
+            y = f(self, x, *args, **kwargs)
             # increase count of the associated operation
             if fwd:
                 if mat:
@@ -1,6 +1,7 @@
 import numpy as np
 import pytest
 from numpy.testing import assert_array_almost_equal
+from scipy.linalg import block_diag
 from scipy.sparse import random as sp_random
 from scipy.sparse.linalg import lsqr
 
@@ -196,6 +197,37 @@ def test_BlockDiag(par):
     )
 
 
+@pytest.mark.parametrize("par", [(par1), (par2), (par1j), (par2j)])
+def test_BlockDiag_stacked(par):
+    """Consistency of BlockDiag operator with explicit block-diagonal matrix
+    when all operators are small MatrixMult of same shape"""
+    np.random.seed(0)
+    ny, nx = par["ny"] // 10, par["nx"] // 10
+    Gs = [
+        (
+            np.random.normal(0, 10, (ny, nx))
+            + par["imag"] * np.random.normal(0, 10, (ny, nx))
+        ).astype(par["dtype"])
+        for _ in range(3)
+    ]
+    x = np.ones(3 * nx) + par["imag"] * np.ones(3 * nx)
+    y = np.ones(3 * ny) + par["imag"] * np.ones(3 * ny)
+
+    BDop = BlockDiag([MatrixMult(G, dtype=par["dtype"]) for G in Gs])
+    assert BDop._stacked is not None
+    assert dottest(BDop, 3 * ny, 3 * nx, complexflag=0 if par["imag"] == 0 else 3)
+    Gbd = block_diag(*Gs)
+    # forward
+    assert_array_almost_equal(BDop * x, Gbd @ x, decimal=8)
+    # adjoint
+    assert_array_almost_equal(BDop.H * y, Gbd.conj().T @ y, decimal=8)
+
+    # large blocks are not stacked
+    G = np.random.normal(0, 10, (par["ny"], par["nx"])).astype(par["dtype"])
+    BDop = BlockDiag([MatrixMult(G, dtype=par["dtype"])] * 3)
+    assert BDop._stacked is None
+
+
 @pytest.mark.parametrize("par", [(par1), (par2), (par1j), (par2j)])
 def test_VStack_multiproc(par):
     """Single and multiprocess consistentcy for VStack operator"""
@@ -294,11 +326,49 @@ def test_BlockDiag_multiproc(par):
     assert_array_almost_equal(BDop * x, BDmultiop * x, decimal=4)
     # adjoint
     assert_array_almost_equal(BDop.H * y, BDmultiop.H * y, decimal=4)
+    # forward and adjoint with column vectors
+    assert_array_almost_equal(
+        BDop.matvec(x[:, None]), BDmultiop.matvec(x[:, None]), decimal=4
+    )
+    assert_array_almost_equal(
+        BDop.rmatvec(y[:, None]), BDmultiop.rmatvec(y[:, None]), decimal=4
+    )
 
     # close pool
     BDmultiop.pool.close()
 
 
+@pytest.mark.parametrize("par", [(par1), (par2), (par1j), (par2j)])
+def test_BlockDiag_multithread(par):
+    """Single and multithread consistentcy for BlockDiag operator"""
+    np.random.seed(0)
+    nproc = 2
+    G = np.random.normal(0, 10, (par["ny"], par["nx"])).astype(par["dtype"])
+    x = np.ones(4 * par["nx"]) + par["imag"] * np.ones(4 * par["nx"])
+    y = np.ones(4 * par["ny"]) + par["imag"] * np.ones(4 * par["ny"])
+
+    BDop = BlockDiag([MatrixMult(G, dtype=par["dtype"])] * 4, dtype=par["dtype"])
+    BDmultiop = BlockDiag(
+        [MatrixMult(G, dtype=par["dtype"])] * 4,
+        nproc=nproc,
+        multiproc=False,
+        dtype=par["dtype"],
+    )
+    assert dottest(
+        BDmultiop,
+        4 * par["ny"],
+        4 * par["nx"],
+        complexflag=0 if par["imag"] == 0 else 3,
+    )
+    # forward
+    assert_array_almost_equal(BDop * x, BDmultiop * x, decimal=4)
+    # adjoint
+    assert_array_almost_equal(BDop.H * y, BDmultiop.H * y, decimal=4)
+
+    # close pool
+    BDmultiop.pool.shutdown()
+
+
 @pytest.mark.parametrize("par", [(par1), (par2), (par1j), (par2j)])
 def test_VStack_rlinear(par):
     """VStack operator applied to mix of R-linear and C-linear operators"""
@@ -1,3 +1,5 @@
+import itertools
+
 import numpy as np
 import pytest
 from numpy.testing import assert_array_almost_equal, assert_array_equal
@@ -551,6 +553,76 @@ def test_SecondDerivative_forwaback(par):
         )
 
 
+@pytest.mark.parametrize("par", [(par1), (par2), (par1e), (par2e)])
+def test_SecondDerivative_engines(par):
+    """Dot-test for SecondDerivative operator with numba engine and comparison
+    of forward and adjoint with numpy engine for all stencils
+    """
+    dims = (par["ny"], par["nx"], par["nz"])
+    for kind in ("forward", "centered", "backward"):
+        for axis in range(3):
+            for ndims in (
+                dims,
+                (dims[0], 3, dims[2]),
+                (dims[0], 2, dims[2]),
+                (dims[0], 1, dims[2]),
+            ):
+                if kind == "centered" and par["edge"] and ndims[axis] < 3:
+                    with pytest.raises(ValueError):
+                        SecondDerivative(ndims, axis=axis, kind=kind, edge=True)
+                    continue
+                D2op = SecondDerivative(
+                    ndims,
+                    axis=axis,
+                    sampling=par["dx"],
+                    edge=par["edge"],
+                    kind=kind,
+                    dtype="float64",
+                )
+                D2op_nb = SecondDerivative(
+                    ndims,
+                    axis=axis,
+                    sampling=par["dx"],
+                    edge=par["edge"],
+                    kind=kind,
+                    engine="numba",
+                    dtype="float64",
+                )
+                assert dottest(D2op_nb, D2op.shape[0], D2op.shape[1], rtol=1e-6)
+
+                x = np.random.normal(0.0, 1.0, D2op.shape[1])
+                assert_array_almost_equal(D2op @ x, D2op_nb @ x, decimal=8)
+                assert_array_almost_equal(D2op.H @ x, D2op_nb.H @ x, decimal=8)
+                # edges of centered stencil without edge are exactly zero
+                if kind == "centered" and not par["edge"] and ndims[axis] >= 3:
+                    y = np.moveaxis((D2op @ x).reshape(ndims), axis, 0)
+                    assert_array_equal(y[[0, -1]], 0.0)
+                # no sample can be computed with less than three samples
+                if ndims[axis] < 3:
+                    assert_array_equal(D2op @ x, np.zeros(D2op.shape[0]))
+                    assert_array_equal(D2op.H @ x, np.zeros(D2op.shape[1]))
+
+
+@pytest.mark.parametrize("engine", ["numpy", "numba"])
+def test_SecondDerivative_short_axis(engine):
+    """SecondDerivative operator along axis with less than three samples
+    (output must be fully overwritten with zeros)"""
+    for kind, edge in itertools.product(
+        ("forward", "centered", "backward"), (False, True)
+    ):
+        if kind == "centered" and edge:
+            continue
+        for nx in (1, 2):
+            D2op = SecondDerivative(
+                (4, nx), axis=1, kind=kind, edge=edge, engine=engine
+            )
+            x = np.random.normal(0.0, 1.0, D2op.shape[1])
+            y = np.full(D2op.shape[0], np.nan)
+            assert_array_equal(D2op.matvec_into(x, y), np.zeros(D2op.shape[0]))
+            y = np.full(D2op.shape[1], np.nan)
+            assert_array_equal(D2op.rmatvec_into(x, y), np.zeros(D2op.shape[1]))
+
+
 @pytest.mark.parametrize(
     "par", [(par1), (par2), (par3), (par4), (par1e), (par2e), (par3e), (par4e)]
 )
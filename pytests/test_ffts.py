@@ -429,7 +429,7 @@ par_lists_fft2d_random_real = dict(
         (np.longdouble, 11),
     ],
     ifftshift_before=[False, True],
-    engine=["numpy", "scipy"],
+    engine=["numpy", "fftw", "scipy"],
 )
 pars_fft2d_random_real = [
     dict(zip(par_lists_fft2d_random_real.keys(), value))
@@ -474,6 +474,92 @@ def test_FFT2D_random_real(par):
     assert dottest(FFTop, nr, nc, complexflag=2, rtol=10 ** (-decimal))
 
 
+@pytest.mark.parametrize("par", [(par1), (par2), (par3), (par4)])
+def test_FFT2D_workers(par):
+    """Dot-test for FFT2D operator with scipy engine and workers, and
+    comparison with numpy engine"""
+    np.random.seed(5)
+    nt, nx = par["nt"], par["nx"]
+    x = np.random.randn(nt, nx)
+    if not par["real"]:
+        x = x + 1j * np.random.randn(nt, nx)
+    x = x.astype(par["dtype"]).ravel()
+
+    FFTop = FFT2D(
+        dims=(nt, nx),
+        nffts=par["nfft"],
+        real=par["real"],
+        engine="numpy",
+        dtype=par["dtype"],
+    )
+    FFTop_workers = FFT2D(
+        dims=(nt, nx),
+        nffts=par["nfft"],
+        real=par["real"],
+        engine="scipy",
+        dtype=par["dtype"],
+        workers=2,
+    )
+    assert dottest(
+        FFTop_workers,
+        *FFTop_workers.shape,
+        complexflag=0 if par["real"] else 2,
+        rtol=1e-4,
+    )
+
+    y = FFTop * x
+    assert_array_almost_equal(y, FFTop_workers * x, decimal=4)
+    assert_array_almost_equal(FFTop.H * y, FFTop_workers.H * y, decimal=4)
+
+
+@pytest.mark.parametrize("par", [(par1), (par2), (par3), (par4)])
+def test_FFT2D_precision(par):
+    """Single and double precision consistency for FFT2D operator
+    with scipy engine"""
+    np.random.seed(5)
+    nt, nx = par["nt"], par["nx"]
+    x = np.random.randn(nt, nx)
+    if not par["real"]:
+        x = x + 1j * np.random.randn(nt, nx)
+    x = x.astype(par["dtype"]).ravel()
+
+    FFTop = FFT2D(
+        dims=(nt, nx),
+        nffts=par["nfft"],
+        real=par["real"],
+        engine="scipy",
+        dtype=par["dtype"],
+        precision="double",
+    )
+    FFTop32 = FFT2D(
+        dims=(nt, nx),
+        nffts=par["nfft"],
+        real=par["real"],
+        engine="scipy",
+        dtype=par["dtype"],
+        precision="single",
+    )
+    assert dottest(
+        FFTop32, *FFTop32.shape, complexflag=0 if par["real"] else 2, rtol=1e-4
+    )
+
+    assert FFTop32.cdtype == np.complex64
+    assert FFTop32.dtype == np.complex64
+    assert FFTop32.rdtype == (np.float32 if par["real"] else np.complex64)
+
+    y, y32 = FFTop * x, FFTop32 * x
+    assert y32.dtype == FFTop32.cdtype
+    assert_array_almost_equal(y, y32, decimal=4)
+    xadj, xadj32 = FFTop.H * y, FFTop32.H * y
+    assert xadj32.dtype == FFTop32.rdtype
+    assert_array_almost_equal(xadj, xadj32, decimal=4)
+
+    with pytest.raises(ValueError):
+        FFT2D(dims=(nt, nx), engine="scipy", precision="half")
+    with pytest.raises(ValueError):
+        FFT2D(dims=(nt, nx), engine="fftw", precision="garbage")
+
+
 par_lists_fft2d_random_cpx = dict(
     shape=[
         np.random.randint(1, 5, size=(2,)),
@@ -491,7 +577,7 @@ par_lists_fft2d_random_cpx = dict(
     ],
     ifftshift_before=itertools.product([False, True], [False, True]),
     fftshift_after=itertools.product([False, True], [False, True]),
-    engine=["numpy", "scipy"],
+    engine=["numpy", "fftw", "scipy"],
 )
 # Generate all combinations of the above parameters
 pars_fft2d_random_cpx = [
@@ -1234,7 +1320,21 @@ def test_FFT_3dsignal(par):
         assert_array_almost_equal(d[..., :imax], dinv[..., :imax], decimal=decimal)
 
 
-@pytest.mark.parametrize("par", [(par1), (par2), (par3), (par4), (par6)])
+@pytest.mark.parametrize(
+    "par",
+    [
+        (par1),
+        (par2),
+        (par3),
+        (par4),
+        (par6),
+        (par1w),
+        (par2w),
+        (par3w),
+        (par4w),
+        (par5w),
+    ],
+)
 def test_FFT2D(par):
     """Dot-test and inversion for FFT2D operator for 2d signal"""
     decimal = 3 if np.real(np.ones(1, par["dtype"])).dtype == np.float32 else 8
@@ -1254,6 +1354,7 @@ def test_FFT2D(par):
         sampling=(dt, dx),
         real=par["real"],
         axes=(0, 1),
+        engine=par["engine"],
     )
 
     if par["real"]:
@@ -1300,6 +1401,7 @@ def test_FFT2D(par):
         sampling=(dx, dt),
         real=par["real"],
         axes=(1, 0),
+        engine=par["engine"],
     )
 
     if par["real"]:
@@ -6,15 +6,18 @@ from scipy.sparse.linalg import LinearOperator as spLinearOperator
 import pylops
 from pylops import LinearOperator
 from pylops.basicoperators import (
+    BlockDiag,
     Diagonal,
     FirstDerivative,
     HStack,
     MatrixMult,
     Real,
+    SecondDerivative,
     Symmetrize,
     VStack,
     Zero,
 )
+from pylops.signalprocessing import FFT2D
 from pylops.utils import dottest
 
 par1 = {"ny": 11, "nx": 11, "imag": 0, "dtype": "float64"}  # square real
@@ -366,3 +369,43 @@ def test_counts(par):
     assert Aop.rmatvec_count == 0
     assert Aop.matmat_count == 0
     assert Aop.rmatmat_count == 0
+
+
+@pytest.mark.parametrize("par", [(par1), (par2), (par1j), (par2j)])
+def test_matvec_into(par):
+    """Apply matvec_into and rmatvec_into to operators with and without
+    support for preallocated outputs and compare with matvec and rmatvec"""
+    np.random.seed(10)
+    A = np.random.normal(0, 10, (par["ny"], par["nx"])) + par[
+        "imag"
+    ] * np.random.normal(0, 10, (par["ny"], par["nx"]))
+    Ops = [
+        MatrixMult(A, dtype=par["dtype"]),
+        BlockDiag([MatrixMult(A, dtype=par["dtype"])] * 3),
+        BlockDiag([MatrixMult(A, dtype=par["dtype"]), Diagonal(np.ones(par["nx"]))]),
+        SecondDerivative((par["ny"], par["nx"]), axis=0, dtype=par["dtype"]),
+        FFT2D((par["ny"], par["nx"]), dtype="complex128"),
+    ]
+    for Op in Ops:
+        x = np.random.normal(0, 1, Op.shape[1]).astype(Op.dtype)
+        y = np.random.normal(0, 1, Op.shape[0]).astype(Op.dtype)
+        out = np.empty(Op.shape[0], dtype=Op.dtype)
+        outadj = np.empty(Op.shape[1], dtype=Op.dtype)
+
+        yout = Op.matvec_into(x, out)
+        xout = Op.rmatvec_into(y, outadj)
+        assert yout is out
+        assert xout is outadj
+        assert_array_almost_equal(out, Op.matvec(x), decimal=8)
+        assert_array_almost_equal(outadj, Op.rmatvec(y), decimal=8)
+        assert Op.matvec_count == 2
+        assert Op.rmatvec_count == 2
+
+        with pytest.raises(ValueError):
+            Op.matvec_into(x, outadj[:-1])
+
+        # output overlapping with input (square operators)
+        if Op.shape[0] == Op.shape[1]:
+            xin, yin = x.copy(), y.copy()
+            assert_array_almost_equal(Op.matvec_into(xin, xin), Op.matvec(x))
+            assert_array_almost_equal(Op.rmatvec_into(yin, yin), Op.rmatvec(y))
@@ -49,6 +49,20 @@ def test_predict_trace(par):
         dottest(Fop, par["nt"], par["nt"])
 
 
+@pytest.mark.parametrize("par", [(par1)])
+def test_predict_trace_engines(par):
+    """Compare numpy and numba engines of _predict_trace operator"""
+    t = np.arange(par["nt"]) * par["dt"]
+    x = np.random.normal(0, 1, par["nt"])
+    for slope in [-0.2, 0.0, 0.3]:
+        for adj in (False, True):
+            y_np = _predict_trace(x, t, par["dt"], par["dx"], slope, adj=adj)
+            y_nb = _predict_trace(
+                x, t, par["dt"], par["dx"], slope, adj=adj, engine="numba"
+            )
+            assert_array_almost_equal(y_np, y_nb, decimal=6)
+
+
 @pytest.mark.parametrize("par", [(par1)])
 def test_predict(par):
     """Dot-test for _predict operator"""
@@ -117,3 +131,27 @@ def test_Seislet(par):
         y = Sop * x
         xinv = Sop.inverse(y)
         assert_array_almost_equal(x, xinv)
+
+
+@pytest.mark.parametrize("par", [(par1), (par3)])
+def test_Seislet_engines(par):
+    """Compare numpy and numba engines of Seislet"""
+    slope = np.random.normal(0, 0.1, (par["nx"], par["nt"]))
+    x = np.random.normal(0, 0.1, par["nx"] * par["nt"])
+
+    for kind in ("haar", "linear"):
+        Sop_np, Sop_nb = [
+            Seislet(
+                slope,
+                sampling=(par["dx"], par["dt"]),
+                level=par["level"],
+                kind=kind,
+                dtype=par["dtype"],
+                engine=engine,
+            )
+            for engine in ("numpy", "numba")
+        ]
+        y = Sop_np * x
+        assert_array_almost_equal(y, Sop_nb * x, decimal=6)
+        assert_array_almost_equal(Sop_np.H * y, Sop_nb.H * y, decimal=6)
+        assert_array_almost_equal(Sop_np.inverse(y), Sop_nb.inverse(y), decimal=6)